@@ -1,24 +1,154 @@
 """Module for interacting with QuestDB."""
 
-from types import TracebackType
-from typing import Iterable, Type, overload, AsyncGenerator, Any, TypeVar, Callable
+from functools import lru_cache
+from keyword import iskeyword
+from types import TracebackType, UnionType
+from typing import Iterable, Type, overload, AsyncGenerator, Any, TypeVar, Callable, Union, get_args, get_origin
 
 import aiohttp
 import pandas as pd
 import msgspec
 import requests
+from requests.adapters import HTTPAdapter
 from questdb.ingress import Sender
 
-from py_questdb.db_types import QuestMessage, QuestDBResponse, TYPE_MAP, convert_types
+from py_questdb.db_types import QuestMessage, QuestDBColumn, QuestDBResponse, COLUMN_TYPES, convert_types, columns_to_df
 
 
 T = TypeVar("T")
 
+_RESPONSE_DECODER = msgspec.json.Decoder(QuestDBResponse)
+_READ_CHUNK_SIZE = 64 * 1024
+_CONVERT_SLICE_ROWS = 8192
+
+
+def _write_row(target: Sender, msg: QuestMessage) -> None:
+    """
+    Write a single message as a row, passing its fields straight through as arguments.
+
+    Args:
+        target: The Sender (or Buffer) to write the row to.
+        msg: The QuestMessage to write.
+    """
+    fields = msg.to_quest_db_format()
+    target.row(fields["table_name"], symbols=fields["symbols"], columns=fields["columns"], at=fields["at"])
+
+
+@lru_cache(maxsize=128)
+def _compile_row_builder(names: tuple[str, ...], into_type: type | None) -> Callable[[tuple], Any]:
+    """
+    Compile a straight-line function assembling a typed dataset row for the given column names.
+
+    Args:
+        names: Column names, in response order.
+        into_type: Optional type to construct from each row instead of returning a dict.
+
+    Returns:
+        A function taking a row tuple and returning a dict or into_type instance.
+    """
+    values = [f"_v{i}" for i in range(len(names))]
+    if into_type is not None and all(name.isidentifier() and not iskeyword(name) for name in names):
+        arguments = dict(zip(names, values))
+        args = []
+        if isinstance(into_type, type) and issubclass(into_type, msgspec.Struct):
+            # Pass the leading fields positionally, which msgspec handles without building a kwargs mapping.
+            # __match_args__ lists the positional fields in order without resolving their annotations.
+            for name in into_type.__match_args__:
+                if name not in arguments:
+                    break
+                args.append(arguments.pop(name))
+        args.extend(f"{name}={value}" for name, value in arguments.items())
+        body = f"_into({', '.join(args)})"
+    else:
+        body = "{" + ", ".join(f"{name!r}: {value}" for name, value in zip(names, values)) + "}"
+        if into_type is not None:
+            body = f"_into(**{body})"
+
+    namespace: dict[str, Any] = {"_into": into_type}
+    unpack = f"    {''.join(f'{value}, ' for value in values)}= row\n" if names else ""
+    exec(f"def _build_row(row):\n{unpack}    return {body}\n", namespace)
+    return namespace["_build_row"]
+
+
+@lru_cache(maxsize=128)
+def _column_dataset_type(column_types: tuple[str, ...]) -> Any:
+    """
+    Build the msgspec type for converting a whole dataset into rows typed by their QuestDB column types.
+
+    Args:
+        column_types: QuestDB column types, in response order.
+
+    Returns:
+        A ``list[tuple[...]]`` type with one nullable element per column. Unknown column types are passed through.
+    """
+    return list[tuple[tuple(COLUMN_TYPES[t] | None if t in COLUMN_TYPES else Any for t in column_types)]]
+
+
+def _accepts_column_type(annotation: Any, column_type: type) -> bool:
+    """
+    Check whether a field annotation is a plain, optionally nullable, Python type every value of a column fits.
+
+    Args:
+        annotation: The Struct field annotation.
+        column_type: The Python type msgspec parses the column into, from COLUMN_TYPES.
+
+    Returns:
+        True if the annotation is column_type, ``column_type | None``, or float for an integer column.
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return False
+        annotation = args[0]
+    return annotation is column_type or (annotation is float and column_type is int)
+
+
+@lru_cache(maxsize=64)
+def _struct_dataset_type(
+    into_type: type[msgspec.Struct], names: tuple[str, ...], column_types: tuple[str, ...]
+) -> Any | None:
+    """
+    Build the msgspec type for converting a whole dataset into rows typed by a Struct's field annotations.
+
+    The decision is made once per Struct and column schema, so the row types never depend on the data returned.
+
+    Args:
+        into_type: The msgspec Struct each row will be constructed as.
+        names: Column names, in response order.
+        column_types: QuestDB column types, in response order.
+
+    Returns:
+        A ``list[tuple[...]]`` type with one nullable element per column, or None if a column is not a field of
+        into_type, its field annotation does not accept every value of the column's type, or the annotations
+        cannot be resolved.
+    """
+    try:
+        field_types = {field.name: field.type for field in msgspec.structs.fields(into_type)}
+    except (NameError, TypeError):
+        # Annotations that can't be resolved at runtime, e.g. TYPE_CHECKING imports or undefined forward references
+        return None
+
+    for name, column_type in zip(names, column_types):
+        if name not in field_types or column_type not in COLUMN_TYPES:
+            return None
+        if not _accepts_column_type(field_types[name], COLUMN_TYPES[column_type]):
+            return None
+
+    return list[tuple[tuple(field_types[name] | None for name in names)]]
+
 
 class QuestDB:
     """A class to interact with QuestDB for querying and writing data."""
 
-    def __init__(self, host: str = "localhost", port: int = 9000, username: str | None = None, password: str | None = None):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 9000,
+        username: str | None = None,
+        password: str | None = None,
+        pool_maxsize: int = 10,
+        write_batch_rows: int = 75_000,
+    ):
         """
         Initialize a QuestDB connection.
 
@@ -27,15 +157,25 @@ class QuestDB:
             port: The port number for the HTTP interface. Defaults to 9000.
             username: Optional username for authentication.
             password: Optional password for authentication.
+            pool_maxsize: Maximum number of keep-alive connections kept open for synchronous queries.
+            write_batch_rows: Maximum number of rows write and write_iter send per flush. Defaults to 75,000,
+                matching the client's HTTP auto-flush threshold.
 
         Note:
             The TCP default port is 9009 and the HTTP default port is 9000.
         """
-        self.url = f"http://{host}:{9000}"
+        self.url = f"http://{host}:{port}"
+        self._exec_url = f"{self.url}/exec"
         self.client = Sender("http", host, port, username=username, password=password, auto_flush=True)
 
         self.client.establish()  # unclear if this blocks, API keeps changing!
-        self.session = None
+        self._write_buffer = self.client.new_buffer()
+        self._write_batch_rows = write_batch_rows
+        self.session: aiohttp.ClientSession | None = None
+
+        # Reuse HTTP connections across synchronous queries instead of reconnecting per request
+        self._sync_session = requests.Session()
+        self._sync_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize))
 
     def flush(self) -> None:
         """Flush the QuestDB client buffer."""
@@ -48,20 +188,37 @@ class QuestDB:
         Args:
             *messages: Variable number of QuestMessage objects to write.
         """
-        for msg in messages:
-            self.client.row(**msg.to_quest_db_format())
-        self.client.flush()
+        self.write_iter(messages)
 
     def write_iter(self, messages: Iterable[QuestMessage]) -> None:
         """
         Write an iterable of messages to QuestDB.
 
+        The rows are built in a reusable buffer and flushed every write_batch_rows rows, so memory and request
+        size stay bounded for arbitrarily long iterables.
+
         Args:
             messages: An iterable of QuestMessage objects to write.
         """
-        for msg in messages:
-            self.client.row(**msg.to_quest_db_format())
-        self.client.flush()
+        # Send anything already buffered first so rows keep their write order
+        if len(self.client):
+            self.client.flush()
+
+        buffer, batch_rows, rows = self._write_buffer, self._write_batch_rows, 0
+        try:
+            for msg in messages:
+                _write_row(buffer, msg)
+                rows += 1
+                if rows == batch_rows:
+                    self.client.flush(buffer)
+                    rows = 0
+
+            if rows:
+                self.client.flush(buffer)
+        except BaseException:
+            # Don't leave a partial batch behind to be sent by the next write
+            buffer.clear()
+            raise
 
     def buffer_write(self, *messages: QuestMessage) -> None:
         """
@@ -70,8 +227,9 @@ class QuestDB:
         Args:
             *messages: Variable number of QuestMessage objects to buffer.
         """
+        client = self.client
         for msg in messages:
-            self.client.row(**msg.to_quest_db_format())
+            _write_row(client, msg)
 
     def buffer_write_iter(self, messages: Iterable[QuestMessage]) -> None:
         """
@@ -80,25 +238,39 @@ class QuestDB:
         Args:
             messages: An iterable of QuestMessage objects to buffer.
         """
+        client = self.client
         for msg in messages:
-            self.client.row(**msg.to_quest_db_format())
+            _write_row(client, msg)
+
+    async def connect(self) -> None:
+        """Open the aiohttp session used for asynchronous queries, if not already open."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
 
-    async def _query(self, query_string: str) -> bytes:
+    async def _query(self, query_string: str) -> bytearray:
         """
         Perform an asynchronous query to QuestDB.
 
+        The body is streamed into a single growing buffer rather than collecting every chunk and joining
+        them into a second full-size copy, which roughly halves peak memory for large result sets.
+
         Args:
             query_string: The SQL query string to execute.
 
         Returns:
-            The raw bytes response from the server.
+            The raw response body from the server.
         """
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        # Reopens the session if it was closed, e.g. by close() or leaving an ``async with`` block
+        await self.connect()
 
-        async with self.session.get(f"{self.url}/exec", params={"query": query_string}) as response:
+        async with self.session.get(self._exec_url, params={"query": query_string}) as response:
             response.raise_for_status()
-            return await response.read()
+
+            buffer = bytearray()
+            async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+                buffer += chunk
+
+            return buffer
 
     def _query_sync(self, query_string: str) -> bytes:
         """
@@ -110,23 +282,42 @@ class QuestDB:
         Returns:
             The raw bytes response from the server.
         """
-        response = requests.get(f"{self.url}/exec", {"query": query_string})
+        response = self._sync_session.get(self._exec_url, params={"query": query_string})
         response.raise_for_status()
 
         return response.content
 
     @staticmethod
-    def parse_query_response(response: bytes) -> QuestDBResponse:
+    def parse_query_response(response: bytes | bytearray) -> QuestDBResponse:
         """
         Parse the raw bytes response from QuestDB into a QuestDBResponse object.
 
         Args:
-            response: The raw bytes response from the server.
+            response: The raw response body from the server.
 
         Returns:
             A QuestDBResponse object representing the parsed response.
         """
-        return msgspec.json.decode(response, type=QuestDBResponse)
+        return _RESPONSE_DECODER.decode(response)
+
+    @staticmethod
+    def parse_query_response_columnar(response: bytes | bytearray) -> tuple[list[QuestDBColumn], list[tuple]]:
+        """
+        Parse the raw bytes response from QuestDB into its columns and column-major values.
+
+        The row-major dataset is transposed in a single pass and released before returning, so it is not kept
+        alive alongside the DataFrame built from the columns.
+
+        Args:
+            response: The raw response body from the server.
+
+        Returns:
+            The response columns, and one tuple of cell values per column.
+        """
+        data = _RESPONSE_DECODER.decode(response)
+        values = list(zip(*data.dataset)) if data.dataset else [() for _ in data.columns]
+
+        return data.columns, values
 
     @staticmethod
     def parse_and_yield_query_response(response: QuestDBResponse, into_type: Type[T] | None) -> Iterable[T] | Iterable[dict]:
@@ -140,15 +331,22 @@ class QuestDB:
         Yields:
             Parsed rows as either dictionaries or instances of the specified type.
         """
-        type_converter = [TYPE_MAP[col.type] for col in response.columns]
-
-        for row in response.dataset:
-            converted_row = {
-                field.name: converter(value) if value is not None else None
-                for field, converter, value in zip(response.columns, type_converter, row)
-            }
-
-            yield into_type(**converted_row) if into_type else converted_row
+        names = tuple(col.name for col in response.columns)
+
+        # msgspec parses and validates every cell in C, one bounded slice of rows per call
+        column_types = tuple(col.type for col in response.columns)
+        dataset_type = None
+        if isinstance(into_type, type) and issubclass(into_type, msgspec.Struct):
+            dataset_type = _struct_dataset_type(into_type, names, column_types)
+        if dataset_type is None:
+            dataset_type = _column_dataset_type(column_types)
+
+        # Slicing keeps peak memory bounded, and consumers that stop early never convert the rest of the dataset
+        build_row = _compile_row_builder(names, into_type or None)
+        dataset = response.dataset
+        for start in range(0, len(dataset), _CONVERT_SLICE_ROWS):
+            for row in msgspec.convert(dataset[start : start + _CONVERT_SLICE_ROWS], dataset_type, strict=False):
+                yield build_row(row)
 
     @overload
     async def query(self, query_string: str) -> AsyncGenerator[dict[str, Any], None]: ...
@@ -157,7 +355,10 @@ class QuestDB:
     async def query(self, query_string: str, into_type: Type[T]) -> AsyncGenerator[T, None]: ...
 
     async def query(
-        self, query_string: str, into_type: Type[T] | None = None, error_handler: Callable[[bytes], None] | None = None
+        self,
+        query_string: str,
+        into_type: Type[T] | None = None,
+        error_handler: Callable[[bytes | bytearray], None] | None = None,
     ) -> AsyncGenerator[T, None]:
         """
         Perform an asynchronous query and yield the results.
@@ -188,7 +389,10 @@ class QuestDB:
     def query_sync(self, query_string: str, into_type: Type[T]) -> Iterable[T]: ...
 
     def query_sync(
-        self, query_string: str, into_type: Type[T] | None = None, error_handler: Callable[[bytes], None] | None = None
+        self,
+        query_string: str,
+        into_type: Type[T] | None = None,
+        error_handler: Callable[[bytes | bytearray], None] | None = None,
     ) -> Iterable[T] | Iterable[dict]:
         """
         Perform a synchronous query and return an iterable of results.
@@ -220,12 +424,11 @@ class QuestDB:
         Returns:
             A pandas DataFrame containing the query results.
         """
-        data = self.parse_query_response(await self._query(query_string))
+        columns, values = self.parse_query_response_columnar(await self._query(query_string))
 
-        df = convert_types(pd.DataFrame(data.dataset, columns=[col.name for col in data.columns]), data.columns)
+        df, timestamp_col = convert_types(columns_to_df(columns, values), columns)
 
         # Set timestamp as index and sort descending
-        timestamp_col = next((col.name for col in data.columns if col.type == "TIMESTAMP"), None)
         if timestamp_col:
             df.set_index(timestamp_col, inplace=True)
             df.sort_index(ascending=False, inplace=True)
@@ -242,12 +445,11 @@ class QuestDB:
         Returns:
             A pandas DataFrame containing the query results.
         """
-        data = self.parse_query_response(self._query_sync(query_string))
+        columns, values = self.parse_query_response_columnar(self._query_sync(query_string))
 
-        df = convert_types(pd.DataFrame(data.dataset, columns=[col.name for col in data.columns]), data.columns)
+        df, timestamp_col = convert_types(columns_to_df(columns, values), columns)
 
         # Set timestamp as index and sort descending
-        timestamp_col = next((col.name for col in data.columns if col.type == "TIMESTAMP"), None)
         if timestamp_col:
             df.set_index(timestamp_col, inplace=True)
             df.sort_index(ascending=False, inplace=True)
@@ -260,11 +462,12 @@ class QuestDB:
 
         if self.session:
             await self.session.close()
+        self._sync_session.close()
         self.client.close()
 
     async def __aenter__(self) -> "QuestDB":
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession() if not self.session else self.session
+        await self.connect()
         return self
 
     async def __aexit__(
@@ -1,15 +1,18 @@
 """Types and utility functions for interacting with QuestDB."""
 
 import datetime
-from typing import TypedDict, Union, Protocol
+from typing import TypedDict, Union, Protocol, Sequence
 
 import msgspec
+import numpy as np
 import pandas as pd
 from questdb.ingress import TimestampMicros
 
 
 QuestDBField = Union[None, bool, int, float, str, TimestampMicros, datetime.datetime]
 
+# Legacy per-value converters, kept for existing importers only. Query rows are now converted by msgspec
+# using COLUMN_TYPES below, so nothing in this package uses TYPE_MAP.
 TYPE_MAP = {
     "SYMBOL": str,
     "BOOLEAN": bool,
@@ -21,6 +24,21 @@ TYPE_MAP = {
     "STRING": str,
 }
 
+# Python types msgspec converts QuestDB column types into, parsing them in C rather than per value in Python
+COLUMN_TYPES = {
+    "SYMBOL": str,
+    "BOOLEAN": bool,
+    "BYTE": int,
+    "SHORT": int,
+    "INT": int,
+    "LONG": int,
+    "FLOAT": float,
+    "DOUBLE": float,
+    "VARCHAR": str,
+    "TIMESTAMP": datetime.datetime,
+    "STRING": str,
+}
+
 
 class QuestDBColumn(msgspec.Struct):
     """Represents a column in a QuestDB table."""
@@ -29,38 +47,147 @@ class QuestDBColumn(msgspec.Struct):
     type: str
 
 
-def convert_types(df: pd.DataFrame, columns: list[QuestDBColumn]) -> pd.DataFrame:
+class QuestDBResponse(msgspec.Struct):
+    """Represents a response from a QuestDB query."""
+
+    query: str
+    columns: list[QuestDBColumn]
+    timestamp: int
+    dataset: list[tuple]
+    count: int
+
+
+def _parse_timestamps(values: Sequence[str | None]) -> pd.DatetimeIndex | np.ndarray:
+    """
+    Parse a column of QuestDB timestamps into a UTC datetime array.
+
+    QuestDB emits UTC ISO 8601 strings with a trailing "Z", which NumPy parses in C once the suffix is dropped.
+    Values are held at nanosecond resolution, as pd.to_datetime produces. Anything NumPy rejects is returned as an
+    object array and left to pd.to_datetime in convert_types.
+
+    Args:
+        values: ISO 8601 timestamp strings, or None for nulls.
+
+    Returns:
+        A UTC DatetimeIndex, or an object array if the strings could not be parsed.
+    """
+    try:
+        parsed = np.array([None if value is None else value.rstrip("Z") for value in values], dtype="datetime64[ns]")
+    except ValueError:
+        return np.array(values, dtype=object)
+
+    return pd.DatetimeIndex(parsed).tz_localize("UTC")
+
+
+def _downcast_integers(values: np.ndarray) -> np.ndarray:
+    """
+    Downcast an int64 array to the smallest signed integer dtype holding all of its values.
+
+    Args:
+        values: The int64 array to downcast.
+
+    Returns:
+        The array cast to int8, int16, int32 or int64. Empty arrays become int8, as with pd.to_numeric.
+    """
+    low, high = (np.min(values), np.max(values)) if len(values) else (0, 0)
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return values.astype(dtype)
+    return values
+
+
+def _downcast_floats(values: np.ndarray) -> np.ndarray:
+    """
+    Downcast a float64 array to float32 unless a finite value is outside the float32 range.
+
+    Args:
+        values: The float64 array to downcast.
+
+    Returns:
+        The array cast to float32, or unchanged if float32 would overflow.
+    """
+    finite = values[np.isfinite(values)]
+    info = np.finfo(np.float32)
+    if len(finite) and (np.min(finite) < info.min or np.max(finite) > info.max):
+        return values
+    return values.astype(np.float32)
+
+
+def columns_to_df(columns: list[QuestDBColumn], values: list[Sequence]) -> pd.DataFrame:
+    """
+    Build a DataFrame from column-major query results.
+
+    Numeric and timestamp columns are handed to pandas as typed arrays so no per-column dtype inference is
+    needed; all other columns are passed as object arrays, as pandas would infer from row tuples. Numeric columns
+    are downcast to the smallest dtype holding their values, as pd.to_numeric(downcast=...) does.
+
+    Args:
+        columns: List of QuestDBColumn objects, in response order.
+        values: One sequence of cell values per column, in the same order.
+
+    Returns:
+        DataFrame with one column per response column, in response order.
+    """
+    data = {}
+    for col, col_values in zip(columns, values):
+        if col.type in ["BOOLEAN", "BYTE", "SHORT", "INT", "LONG"]:
+            # Nulls can only be held as NaN, as pd.to_numeric would produce
+            if None in col_values:
+                data[col.name] = np.array(col_values, dtype=np.float64)
+            elif col.type == "BOOLEAN" and len(col_values):
+                data[col.name] = np.array(col_values, dtype=bool)
+            else:
+                data[col.name] = _downcast_integers(np.array(col_values, dtype=np.int64))
+        elif col.type in ["FLOAT", "DOUBLE"]:
+            data[col.name] = _downcast_floats(np.array(col_values, dtype=np.float64))
+        elif col.type == "TIMESTAMP":
+            data[col.name] = _parse_timestamps(col_values)
+        else:
+            data[col.name] = np.array(col_values, dtype=object)
+
+    return pd.DataFrame(data, columns=[col.name for col in columns], copy=False)
+
+
+def convert_types(df: pd.DataFrame, columns: list[QuestDBColumn]) -> tuple[pd.DataFrame, str | None]:
     """
     Convert DataFrame column types based on QuestDB column definitions.
 
+    Numeric and timestamp columns that are already typed, as columns_to_df builds them, are left unchanged; only
+    object columns are converted.
+
     Args:
         df: Input DataFrame.
         columns: List of QuestDBColumn objects defining column types.
 
     Returns:
-        DataFrame with converted column types.
+        DataFrame with converted column types, and the name of the first TIMESTAMP column (None if there is none).
     """
+    timestamp_cols, int_cols, float_cols, str_cols = [], [], [], []
     for col in columns:
         if col.type == "TIMESTAMP":
-            df[col.name] = pd.to_datetime(df[col.name])
+            timestamp_cols.append(col.name)
         elif col.type in ["BOOLEAN", "BYTE", "SHORT", "INT", "LONG"]:
-            df[col.name] = pd.to_numeric(df[col.name], downcast="integer")
+            int_cols.append(col.name)
         elif col.type in ["FLOAT", "DOUBLE"]:
-            df[col.name] = pd.to_numeric(df[col.name], downcast="float")
+            float_cols.append(col.name)
         elif col.type == "STRING":
-            df[col.name] = df[col.name].astype(str)
-
-    return df
-
-
-class QuestDBResponse(msgspec.Struct):
-    """Represents a response from a QuestDB query."""
-
-    query: str
-    columns: list[QuestDBColumn]
-    timestamp: int
-    dataset: list[tuple]
-    count: int
+            str_cols.append(col.name)
+
+    # Converters are called per column, as DataFrame.apply skips them entirely on an empty frame
+    for name in timestamp_cols:
+        if df[name].dtype == object:
+            df[name] = pd.to_datetime(df[name], format="ISO8601")
+    for name in int_cols:
+        if df[name].dtype == object:
+            df[name] = pd.to_numeric(df[name], downcast="integer")
+    for name in float_cols:
+        if df[name].dtype == object:
+            df[name] = pd.to_numeric(df[name], downcast="float")
+    if str_cols:
+        df[str_cols] = df[str_cols].astype(str)
+
+    return df, timestamp_cols[0] if timestamp_cols else None
 
 
 class QuestDBFields(TypedDict):
@@ -5,17 +5,26 @@ USAGE:
     logger.addHandler(handler)
 """
 
+import functools
 import logging
+import multiprocessing
+import queue
 from logging.handlers import QueueHandler, QueueListener
-from multiprocessing import Queue
 from datetime import datetime
 from typing import Optional
 from py_questdb import QuestDB
 
 
 class QuestDBLogHandler(QueueHandler):
-    def __init__(self, questdb_client: QuestDB, table_name: str = "_logs", level: Optional[str] = None):
-        self.queue = Queue()
+    def __init__(
+        self,
+        questdb_client: QuestDB,
+        table_name: str = "_logs",
+        level: Optional[str] = None,
+        multiprocess: bool = False,
+    ):
+        # An in-process queue hands records over by reference; only pay for pickling when logging across processes
+        self.queue = multiprocessing.Queue() if multiprocess else queue.Queue()
         super().__init__(self.queue)
 
         if level:
@@ -51,37 +60,30 @@ class InnerQuestDBLogHandler(logging.Handler):
         super().__init__()
         self.questdb_client = questdb_client
         self.table_name = table_name
+        self._row = functools.partial(questdb_client.client.row, table_name)
 
     def emit(self, record: logging.LogRecord):
         try:
-            print(f"Received {record=}")
-            log_message = self.format_record(record)
-            print(f"Writing {log_message=}")
-            self.questdb_client.client.row(**log_message)
+            self._row(
+                symbols={
+                    "level": record.levelname,
+                    "logger": record.name,
+                    "filename": record.filename,
+                    "funcName": record.funcName,
+                    "module": record.module,
+                    "processName": record.processName,
+                    "threadName": record.threadName,
+                    "pathname": record.pathname,
+                },
+                columns={
+                    "message": record.getMessage(),
+                    "lineno": record.lineno,
+                    "process": record.process,
+                    "thread": record.thread,
+                    "exc_info": record.exc_info,
+                    "stack_info": record.stack_info,
+                },
+                at=datetime.fromtimestamp(record.created),
+            )
         except Exception as e:
             print(f"Failed to write log to QuestDB: {e}")
-
-    def format_record(self, record: logging.LogRecord) -> dict:
-        print(record.stack_info)
-        return {
-            "table_name": self.table_name,
-            "symbols": {
-                "level": record.levelname,
-                "logger": record.name,
-                "filename": record.filename,
-                "funcName": record.funcName,
-                "module": record.module,
-                "processName": record.processName,
-                "threadName": record.threadName,
-                "pathname": record.pathname,
-            },
-            "columns": {
-                "message": record.getMessage(),
-                "lineno": record.lineno,
-                "process": record.process,
-                "thread": record.thread,
-                "exc_info": record.exc_info,
-                "stack_info": record.stack_info,
-            },
-            "at": datetime.fromtimestamp(record.created),
-        }
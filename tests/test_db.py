@@ -1,3 +1,4 @@
+import msgspec
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -41,8 +42,46 @@ async def test_write(questdb_instance):
 
     msg = TestMsg(number=15, complex=3.14159, string="hello", tf=True, some_symbol="AAPL")
     questdb_instance.write(msg)
-    questdb_instance.client.row.assert_called_once()
-    questdb_instance.client.flush.assert_called_once()
+    questdb_instance._write_buffer.row.assert_called_once()
+    questdb_instance.client.row.assert_not_called()
+    questdb_instance.client.flush.assert_called_once_with(questdb_instance._write_buffer)
+
+
+def test_write_iter_flushes_in_batches(questdb_instance):
+    from tests.test_structs import TestMsg
+
+    questdb_instance._write_batch_rows = 2
+    questdb_instance.write_iter(TestMsg(number=i) for i in range(5))
+
+    assert questdb_instance._write_buffer.row.call_count == 5
+    assert questdb_instance.client.flush.call_count == 3
+    assert all(c.args == (questdb_instance._write_buffer,) for c in questdb_instance.client.flush.call_args_list)
+
+
+def test_write_flushes_pending_rows_first(questdb_instance):
+    from tests.test_structs import TestMsg
+
+    questdb_instance.client.__len__.return_value = 42
+    questdb_instance.write(TestMsg(number=1))
+
+    assert questdb_instance.client.flush.call_args_list[0].args == ()
+    assert questdb_instance.client.flush.call_args_list[1].args == (questdb_instance._write_buffer,)
+
+
+def test_buffer_write_iter(questdb_instance):
+    from tests.test_structs import TestMsg
+
+    ts = datetime(2023, 8, 14, 12)
+    msgs = [TestMsg(number=i, some_symbol="AAPL", timestamp=ts) for i in range(3)]
+    questdb_instance.buffer_write_iter(msgs)
+
+    assert questdb_instance.client.row.call_count == 3
+    args, kwargs = questdb_instance.client.row.call_args
+    assert args == ("test_table",)
+    assert kwargs["symbols"] == {"some_symbol": "AAPL"}
+    assert kwargs["columns"]["number"] == 2
+    assert kwargs["at"] == ts
+    questdb_instance.client.flush.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -63,8 +102,7 @@ async def test_query(questdb_instance, sample_response):
 
 @pytest.mark.asyncio
 async def test_query_df(questdb_instance, sample_response):
-    questdb_instance._query = AsyncMock(return_value=b"{}")
-    questdb_instance.parse_query_response = MagicMock(return_value=sample_response)
+    questdb_instance._query = AsyncMock(return_value=msgspec.json.encode(sample_response))
 
     df = await questdb_instance.query_df("SELECT * FROM test_table")
 
@@ -93,15 +131,185 @@ def test_query_sync(questdb_instance, sample_response):
     assert isinstance(results[0]["timestamp"], datetime)
 
 
-def test_query_df_sync(questdb_instance, sample_response):
+def test_query_sync_into_type(questdb_instance, sample_response):
+    from tests.test_structs import TestMsg
+
+    questdb_instance._query_sync = MagicMock(return_value=b"{}")
+    questdb_instance.parse_query_response = MagicMock(return_value=sample_response)
+
+    results = list(questdb_instance.query_sync("SELECT * FROM test_table", into_type=TestMsg))
+
+    assert results == [
+        TestMsg(
+            number=15,
+            complex=3.14159,
+            string="hello",
+            tf=True,
+            some_symbol="AAPL",
+            timestamp=datetime.fromisoformat("2023-08-14T12:00:00.000000Z"),
+        )
+    ]
+
+
+def test_query_sync_into_type_null_values(questdb_instance, sample_response):
+    from tests.test_structs import TestMsg
+
+    sample_response.dataset = [(None, 2, "hello", True, "AAPL", None)]
     questdb_instance._query_sync = MagicMock(return_value=b"{}")
     questdb_instance.parse_query_response = MagicMock(return_value=sample_response)
 
+    (result,) = questdb_instance.query_sync("SELECT * FROM test_table", into_type=TestMsg)
+
+    assert result.number is None
+    assert result.complex == 2.0 and isinstance(result.complex, float)
+    assert result.timestamp is None
+
+
+def test_query_sync_into_type_mismatched_annotations(questdb_instance, sample_response):
+    class LooseMsg(msgspec.Struct):
+        number: str
+        complex: float
+        string: str
+        tf: bool
+        some_symbol: str
+        timestamp: datetime
+
+    questdb_instance._query_sync = MagicMock(return_value=b"{}")
+    questdb_instance.parse_query_response = MagicMock(return_value=sample_response)
+
+    (result,) = questdb_instance.query_sync("SELECT * FROM test_table", into_type=LooseMsg)
+
+    assert result.number == 15
+    assert result.timestamp == datetime.fromisoformat("2023-08-14T12:00:00.000000Z")
+
+
+def test_query_sync_into_type_unresolvable_annotations(questdb_instance, sample_response):
+    class ForwardRefMsg(msgspec.Struct):
+        number: "Undefined"  # noqa: F821
+        complex: float
+        string: str
+        tf: bool
+        some_symbol: str
+        timestamp: datetime
+
+    questdb_instance._query_sync = MagicMock(return_value=b"{}")
+    questdb_instance.parse_query_response = MagicMock(return_value=sample_response)
+
+    (result,) = questdb_instance.query_sync("SELECT * FROM test_table", into_type=ForwardRefMsg)
+
+    assert result.number == 15
+    assert result.timestamp == datetime.fromisoformat("2023-08-14T12:00:00.000000Z")
+
+
+def test_query_sync_into_type_row_types_do_not_depend_on_data(questdb_instance, sample_response):
+    class IntComplexMsg(msgspec.Struct):
+        number: int
+        complex: int
+        string: str
+        tf: bool
+        some_symbol: str
+        timestamp: datetime
+
+    sample_response.dataset = [
+        (15, 2.0, "hello", True, "AAPL", "2023-08-14T12:00:00.000000Z"),
+        (16, 2.5, "hello", True, "AAPL", "2023-08-14T12:00:00.000000Z"),
+    ]
+    questdb_instance._query_sync = MagicMock(return_value=b"{}")
+    questdb_instance.parse_query_response = MagicMock(return_value=sample_response)
+
+    whole = list(questdb_instance.query_sync("SELECT * FROM test_table", into_type=IntComplexMsg))
+    sample_response.dataset = sample_response.dataset[:1]
+    (first,) = questdb_instance.query_sync("SELECT * FROM test_table", into_type=IntComplexMsg)
+
+    assert [row.complex for row in whole] == [2.0, 2.5]
+    assert type(first.complex) is type(whole[0].complex) is float
+    assert first.timestamp == datetime.fromisoformat("2023-08-14T12:00:00.000000Z")
+
+
+class ReorderedMsg(msgspec.Struct):
+    timestamp: datetime
+    some_symbol: str
+    tf: bool
+    string: str
+    complex: float
+    number: int
+
+
+class GappedMsg(msgspec.Struct):
+    number: int
+    extra: str = "default"
+    complex: float = 0.0
+    string: str = ""
+    tf: bool = False
+    some_symbol: str = ""
+    timestamp: datetime | None = None
+
+
+class KwOnlyMsg(msgspec.Struct, kw_only=True):
+    some_symbol: str
+    number: int
+    complex: float
+    string: str
+    tf: bool
+    timestamp: datetime
+
+
+@pytest.mark.parametrize("into_type", [ReorderedMsg, GappedMsg, KwOnlyMsg])
+def test_query_sync_into_type_field_mapping(questdb_instance, sample_response, into_type):
+    questdb_instance._query_sync = MagicMock(return_value=b"{}")
+    questdb_instance.parse_query_response = MagicMock(return_value=sample_response)
+
+    (result,) = questdb_instance.query_sync("SELECT * FROM test_table", into_type=into_type)
+
+    assert isinstance(result, into_type)
+    assert result.number == 15
+    assert result.complex == pytest.approx(3.14159)
+    assert result.string == "hello"
+    assert result.tf is True
+    assert result.some_symbol == "AAPL"
+    assert result.timestamp == datetime.fromisoformat("2023-08-14T12:00:00.000000Z")
+    if into_type is GappedMsg:
+        assert result.extra == "default"
+
+
+def test_query_sync_null_values(questdb_instance, sample_response):
+    sample_response.dataset = [(None, None, None, None, None, None)]
+    questdb_instance._query_sync = MagicMock(return_value=b"{}")
+    questdb_instance.parse_query_response = MagicMock(return_value=sample_response)
+
+    results = list(questdb_instance.query_sync("SELECT * FROM test_table"))
+
+    assert results == [{col.name: None for col in sample_response.columns}]
+
+
+def test_query_sync_converts_in_slices(questdb_instance, sample_response):
+    sample_response.dataset = [(i, 1.5, "hello", True, "AAPL", "2023-08-14T12:00:00.000000Z") for i in range(5)]
+    questdb_instance._query_sync = MagicMock(return_value=b"{}")
+    questdb_instance.parse_query_response = MagicMock(return_value=sample_response)
+
+    with (
+        patch("py_questdb.db._CONVERT_SLICE_ROWS", 2),
+        patch("py_questdb.db.msgspec.convert", wraps=msgspec.convert) as convert,
+    ):
+        rows = questdb_instance.query_sync("SELECT * FROM test_table")
+        first = next(rows)
+        assert convert.call_count == 1
+        results = [first, *rows]
+
+    assert convert.call_count == 3
+    assert [row["number"] for row in results] == list(range(5))
+    assert results[-1]["timestamp"] == datetime.fromisoformat("2023-08-14T12:00:00.000000Z")
+
+
+def test_query_df_sync(questdb_instance, sample_response):
+    questdb_instance._query_sync = MagicMock(return_value=msgspec.json.encode(sample_response))
+
     df = questdb_instance.query_df_sync("SELECT * FROM test_table")
 
     assert isinstance(df, pd.DataFrame)
     assert len(df) == 1
     assert df.index.name == "timestamp"
+    assert df.index.dtype == "datetime64[ns, UTC]"
     assert df.iloc[0]["number"] == 15
     assert df.iloc[0]["complex"] == pytest.approx(3.14159)
     assert df.iloc[0]["string"] == "hello"
@@ -109,6 +317,24 @@ def test_query_df_sync(questdb_instance, sample_response):
     assert df.iloc[0]["some_symbol"] == "AAPL"
 
 
+def test_query_sync_reuses_session(questdb_instance):
+    questdb_instance._sync_session.get = MagicMock(return_value=MagicMock(content=b"{}"))
+
+    assert questdb_instance._query_sync("SELECT 1") == b"{}"
+    assert questdb_instance._query_sync("SELECT 2") == b"{}"
+
+    assert questdb_instance._sync_session.get.call_count == 2
+    assert questdb_instance._sync_session.get.call_args[1]["params"] == {"query": "SELECT 2"}
+
+
+def test_custom_port():
+    with patch("py_questdb.db.Sender") as mock_sender:
+        db = QuestDB(host="questdb.example.com", port=9123)
+
+    assert db._exec_url == "http://questdb.example.com:9123/exec"
+    assert mock_sender.call_args[0] == ("http", "questdb.example.com", 9123)
+
+
 @pytest.mark.asyncio
 async def test_context_manager(questdb_instance):
     questdb_instance.close = AsyncMock()
@@ -117,3 +343,84 @@ async def test_context_manager(questdb_instance):
         assert isinstance(db, QuestDB)
 
     questdb_instance.close.assert_awaited_once()
+
+
+def test_query_df_sync_downcasts_to_fit_values(questdb_instance, sample_response):
+    sample_response.dataset = [
+        (15, 3.14159, "hello", True, "AAPL", "2023-08-14T12:00:00.000000Z"),
+        (70_000, 1e300, "world", False, "MSFT", "2023-08-14T13:00:00.000000Z"),
+    ]
+    questdb_instance._query_sync = MagicMock(return_value=msgspec.json.encode(sample_response))
+
+    df = questdb_instance.query_df_sync("SELECT * FROM test_table")
+
+    assert df["number"].dtype == "int32"
+    assert df["complex"].dtype == "float64"
+    assert df["tf"].dtype == bool
+    assert sorted(df["number"]) == [15, 70_000]
+
+
+def test_query_df_sync_empty(questdb_instance, sample_response):
+    sample_response.dataset = []
+    questdb_instance._query_sync = MagicMock(return_value=msgspec.json.encode(sample_response))
+
+    df = questdb_instance.query_df_sync("SELECT * FROM test_table")
+
+    assert len(df) == 0
+    assert df.index.name == "timestamp"
+    assert pd.api.types.is_datetime64_any_dtype(df.index.dtype)
+    assert list(df.columns) == ["number", "complex", "string", "tf", "some_symbol"]
+    assert df["number"].dtype == "int8"
+    assert df["complex"].dtype == "float32"
+    assert df["tf"].dtype == "int8"
+    assert df["string"].dtype == object
+    assert df["some_symbol"].dtype == object
+
+
+def test_query_df_sync_null_values(questdb_instance, sample_response):
+    sample_response.dataset = [
+        (None, None, None, True, None, "2023-08-14T12:00:00.000000Z"),
+        (7, 1.5, "hi", False, "AAPL", None),
+    ]
+    questdb_instance._query_sync = MagicMock(return_value=msgspec.json.encode(sample_response))
+
+    df = questdb_instance.query_df_sync("SELECT * FROM test_table")
+
+    assert df.index.tz is not None
+    assert df.index[0] == pd.Timestamp("2023-08-14T12:00:00Z")
+    assert pd.isna(df.index[1])
+    assert df["number"].isna().sum() == 1 and 7 in df["number"].tolist()
+    assert df["complex"].isna().sum() == 1
+
+
+@pytest.mark.asyncio
+async def test_query_streams_body(questdb_instance):
+    async def iter_chunked(_):
+        for chunk in (b'{"query": ', b'"SELECT 1"}'):
+            yield chunk
+
+    response = MagicMock()
+    response.content.iter_chunked = iter_chunked
+    questdb_instance.session = MagicMock(closed=False)
+    questdb_instance.session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+    questdb_instance.session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    assert await questdb_instance._query("SELECT 1") == b'{"query": "SELECT 1"}'
+
+
+@pytest.mark.asyncio
+async def test_query_reopens_closed_session(questdb_instance):
+    closed_session = MagicMock(closed=True)
+    questdb_instance.session = closed_session
+
+    with patch("py_questdb.db.aiohttp.ClientSession") as client_session:
+        session = client_session.return_value
+        session.closed = False
+        session.get.return_value.__aenter__ = AsyncMock(side_effect=RuntimeError("stop"))
+        session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        with pytest.raises(RuntimeError, match="stop"):
+            await questdb_instance._query("SELECT 1")
+
+    assert questdb_instance.session is session
+    closed_session.get.assert_not_called()
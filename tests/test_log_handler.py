@@ -1,5 +1,6 @@
 import pytest
 import logging
+import queue
 from unittest.mock import MagicMock, patch
 from py_questdb import QuestDB
 from py_questdb.log_handler import QuestDBLogHandler, InnerQuestDBLogHandler
@@ -40,6 +41,14 @@ def test_questdb_log_handler_init(mock_questdb_client):
     handler = QuestDBLogHandler(mock_questdb_client)
     assert isinstance(handler.inner_handler, InnerQuestDBLogHandler)
     assert handler.listener is not None
+    assert isinstance(handler.queue, queue.Queue)
+    handler.close()
+
+
+def test_questdb_log_handler_multiprocess_queue(mock_questdb_client):
+    handler = QuestDBLogHandler(mock_questdb_client, multiprocess=True)
+    assert not isinstance(handler.queue, queue.Queue)
+    handler.close()
 
 
 def test_questdb_log_handler_prepare(questdb_log_handler):
@@ -65,6 +74,13 @@ def test_inner_questdb_log_handler_emit(mock_questdb_client):
     handler.emit(record)
     mock_questdb_client.client.row.assert_called_once()
 
+    args, kwargs = mock_questdb_client.client.row.call_args
+    assert args == ("_logs",)
+    assert kwargs["symbols"]["level"] == "INFO"
+    assert kwargs["symbols"]["logger"] == "test_logger"
+    assert kwargs["columns"]["message"] == "Test message"
+    assert kwargs["columns"]["lineno"] == 42
+
 
 def test_setup_logging(mock_questdb_client):
     with patch("logging.getLogger") as mock_get_logger: